@@ -1,6 +1,10 @@
 from django.contrib import admin
+from django.db.models import Q
 
-from .models import Cliente
+from .models import Cliente, somente_digitos
+
+# Termos de busca compostos só por estes caracteres são tratados como CPF/CNPJ
+_CARACTERES_DOCUMENTO = frozenset("0123456789.-/")
 
 
 @admin.register(Cliente)
@@ -12,7 +16,10 @@ class ClienteAdmin(admin.ModelAdmin):
     list_filter = ('ativo', 'tipo_pessoa', 'criado_em')
 
     # Campo de busca (permite buscar por nome ou documento)
-    search_fields = ('nome', 'documento', 'email')
+    search_fields = ('nome', 'documento')
+
+    # Ordem estável para a paginação do autocomplete de cliente
+    ordering = ('nome', 'id')
 
     # Permite editar o status sem entrar no cadastro
     list_editable = ('ativo',)
@@ -25,6 +32,31 @@ class ClienteAdmin(admin.ModelAdmin):
         ('Contato', {'fields': ('email', 'telefone')}),
     )
 
+    def save_model(self, request, obj, form, change):
+        # Edição rápida pela listagem: grava só as colunas alteradas,
+        # sem reescrever a linha inteira do cliente
+        if change and form.changed_data and set(form.changed_data) <= set(self.list_editable):
+            obj.save(update_fields=[*form.changed_data, "atualizado_em"])
+            return
+        super().save_model(request, obj, form, change)
+
+    def get_search_results(self, request, queryset, search_term):
+        # E-mail só entra na busca quando o termo parece um endereço,
+        # evitando mais um ILIKE em toda busca/autocomplete
+        termo = search_term.strip()
+        if "@" in termo:
+            return queryset.filter(email__icontains=termo), False
+        # CPF/CNPJ (mesmo formatado) vira busca por prefixo no documento
+        # normalizado, que o índice de documento consegue atender; o nome
+        # continua na busca para clientes com números no nome
+        if termo and set(termo) <= _CARACTERES_DOCUMENTO:
+            documento = somente_digitos(termo)
+            if documento:
+                return queryset.filter(
+                    Q(documento__startswith=documento) | Q(nome__icontains=termo)
+                ), False
+        return super().get_search_results(request, queryset, search_term)
+
     def status_icon(self, obj):
         return "Ativo" if obj.ativo else "Inativo"
 
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.8 on 2026-10-15 00:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clientes', '0003_alter_cliente_documento'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='cliente',
+            index=models.Index(fields=['ativo', 'tipo_pessoa'], name='cli_ativo_tipo_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='cliente',
+            index=models.Index(fields=['-criado_em'], name='cli_criado_em_idx'),
+        ),
+    ]
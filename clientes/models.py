@@ -1,5 +1,3 @@
-import re
-
 from django.db import models
 from django.core.exceptions import ValidationError
 
@@ -10,12 +8,57 @@ from django.core.exceptions import ValidationError
 # Funções utilitárias: CPF / CNPJ
 # ============================
 
+# Tabela de str.translate que apaga todo caractere ASCII que não é dígito
+_NAO_DIGITOS = dict.fromkeys(c for c in range(128) if not 48 <= c <= 57)
+
+
+def somente_digitos(doc: str) -> str:
+    """
+    Remove tudo que não for dígito ASCII; documentos já normalizados voltam intactos.
+    """
+    if doc.isascii():
+        if doc.isdigit():
+            return doc
+        return doc.translate(_NAO_DIGITOS)
+    return "".join(ch for ch in doc if "0" <= ch <= "9")
+
+
+_CPF_W1 = (10, 9, 8, 7, 6, 5, 4, 3, 2)
+_CPF_W2 = (11,) + _CPF_W1
+_CNPJ_W1 = (5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2)
+_CNPJ_W2 = (6,) + _CNPJ_W1
+
+
+def _gera_dv(nome, weights):
+    """
+    Gera a função do dígito verificador módulo 11 para um vetor de pesos fixo.
+
+    A soma ponderada é desenrolada numa única expressão sobre os bytes ASCII
+    (b[0] * 10 + b[1] * 9 + ... - 48 * soma_dos_pesos), sem laço nem int().
+    """
+    termos = " + ".join(f"b[{i}] * {w}" for i, w in enumerate(weights))
+    codigo = (
+        f"def {nome}(b):\n"
+        f"    resto = ({termos} - {48 * sum(weights)}) % 11\n"
+        f"    return 0 if resto < 2 else 11 - resto\n"
+    )
+    escopo = {}
+    exec(codigo, escopo)
+    return escopo[nome]
+
+
+_cpf_dv1 = _gera_dv("_cpf_dv1", _CPF_W1)
+_cpf_dv2 = _gera_dv("_cpf_dv2", _CPF_W2)
+_cnpj_dv1 = _gera_dv("_cnpj_dv1", _CNPJ_W1)
+_cnpj_dv2 = _gera_dv("_cnpj_dv2", _CNPJ_W2)
+
+
 def valida_cpf(cpf: str) -> bool:
     """
     Validação de CPF apenas pela regra dos dígitos verificadores.
     Não consulta Receita, apenas matemática.
     """
-    cpf = re.sub(r"\D", "", cpf or "")
+    cpf = somente_digitos(cpf or "")
 
     if len(cpf) != 11:
         return False
@@ -24,19 +67,8 @@ def valida_cpf(cpf: str) -> bool:
     if cpf == cpf[0] * 11:
         return False
 
-    def calc_digito(cpf_slice, fator_inicial):
-        total = 0
-        fator = fator_inicial
-        for dig in cpf_slice:
-            total += int(dig) * fator
-            fator -= 1
-        resto = total % 11
-        return "0" if resto < 2 else str(11 - resto)
-
-    d1 = calc_digito(cpf[:9], 10)
-    d2 = calc_digito(cpf[:10], 11)
-
-    return cpf[-2:] == d1 + d2
+    b = cpf.encode("ascii")
+    return b[9] - 48 == _cpf_dv1(b) and b[10] - 48 == _cpf_dv2(b)
 
 
 def valida_cnpj(cnpj: str) -> bool:
@@ -44,7 +76,7 @@ def valida_cnpj(cnpj: str) -> bool:
     Validação de CNPJ apenas pela regra dos dígitos verificadores.
     Não consulta Receita, apenas matemática.
     """
-    cnpj = re.sub(r"\D", "", cnpj or "")
+    cnpj = somente_digitos(cnpj or "")
 
     if len(cnpj) != 14:
         return False
@@ -53,18 +85,8 @@ def valida_cnpj(cnpj: str) -> bool:
     if cnpj == cnpj[0] * 14:
         return False
 
-    def calc_digito(cnpj_slice, pesos):
-        total = sum(int(d) * p for d, p in zip(cnpj_slice, pesos))
-        resto = total % 11
-        return "0" if resto < 2 else str(11 - resto)
-
-    pesos1 = [5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
-    pesos2 = [6] + pesos1
-
-    d1 = calc_digito(cnpj[:12], pesos1)
-    d2 = calc_digito(cnpj[:13], pesos2)
-
-    return cnpj[-2:] == d1 + d2
+    b = cnpj.encode("ascii")
+    return b[12] - 48 == _cnpj_dv1(b) and b[13] - 48 == _cnpj_dv2(b)
 
 
 # ============================
@@ -99,6 +121,11 @@ class Cliente(models.Model):
     class Meta:
         verbose_name = "Cliente"
         verbose_name_plural = "Clientes"
+        indexes = [
+            # filtros laterais do admin (ativo, tipo_pessoa, criado_em)
+            models.Index(fields=["ativo", "tipo_pessoa"], name="cli_ativo_tipo_idx"),
+            models.Index(fields=["-criado_em"], name="cli_criado_em_idx"),
+        ]
 
     def __str__(self):
         return self.nome
@@ -112,19 +139,20 @@ class Cliente(models.Model):
         if not self.documento:
             return
 
-        doc = re.sub(r"\D", "", self.documento)
-
+        # os validadores já normalizam o documento
         if self.tipo_pessoa == "PF":
-            if not valida_cpf(doc):
+            if not valida_cpf(self.documento):
                 raise ValidationError({"documento": "CPF inválido."})
         elif self.tipo_pessoa == "PJ":
-            if not valida_cnpj(doc):
+            if not valida_cnpj(self.documento):
                 raise ValidationError({"documento": "CNPJ inválido."})
 
     def save(self, *args, **kwargs):
         """
         Normaliza o documento para apenas dígitos antes de salvar.
+        Saves parciais (update_fields) sem o documento não o tocam.
         """
-        if self.documento:
-            self.documento = re.sub(r"\D", "", self.documento)
+        update_fields = kwargs.get("update_fields")
+        if self.documento and (update_fields is None or "documento" in update_fields):
+            self.documento = somente_digitos(self.documento)
         super().save(*args, **kwargs)
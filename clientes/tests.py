@@ -1,3 +1,89 @@
-from django.test import TestCase
+from django.contrib.admin.sites import site
+from django.core.exceptions import ValidationError
+from django.test import RequestFactory, SimpleTestCase, TestCase
 
-# Create your tests here.
+from .models import Cliente, somente_digitos, valida_cnpj, valida_cpf
+
+
+class ValidaDocumentoTests(SimpleTestCase):
+    def test_cpf_valido(self):
+        self.assertTrue(valida_cpf("39053344705"))
+        self.assertTrue(valida_cpf("390.533.447-05"))
+
+    def test_cnpj_valido(self):
+        self.assertTrue(valida_cnpj("11222333000181"))
+        self.assertTrue(valida_cnpj("11.222.333/0001-81"))
+
+    def test_digito_verificador_errado(self):
+        self.assertFalse(valida_cpf("39053344704"))
+        self.assertFalse(valida_cpf("39053344715"))
+        self.assertFalse(valida_cnpj("11222333000182"))
+        self.assertFalse(valida_cnpj("11222333000191"))
+
+    def test_digitos_repetidos(self):
+        self.assertFalse(valida_cpf("11111111111"))
+        self.assertFalse(valida_cpf("000.000.000-00"))
+        self.assertFalse(valida_cnpj("11111111111111"))
+
+    def test_tamanho_errado(self):
+        self.assertFalse(valida_cpf("3905334470"))
+        self.assertFalse(valida_cpf("390533447050"))
+        self.assertFalse(valida_cnpj("1122233300018"))
+        # CPF válido não passa como CNPJ e vice-versa
+        self.assertFalse(valida_cnpj("39053344705"))
+        self.assertFalse(valida_cpf("11222333000181"))
+
+    def test_vazio_ou_none(self):
+        for doc in (None, ""):
+            self.assertFalse(valida_cpf(doc))
+            self.assertFalse(valida_cnpj(doc))
+
+    def test_somente_digitos(self):
+        self.assertEqual(somente_digitos("390.533.447-05"), "39053344705")
+        self.assertEqual(somente_digitos("39053344705"), "39053344705")
+        # apenas dígitos ASCII são mantidos
+        self.assertEqual(somente_digitos("12３4"), "124")
+
+
+class ClienteCleanTests(SimpleTestCase):
+    def test_documento_formatado_valido(self):
+        Cliente(tipo_pessoa="PF", nome="X", documento="390.533.447-05").clean()
+        Cliente(tipo_pessoa="PJ", nome="X", documento="11.222.333/0001-81").clean()
+
+    def test_documento_invalido(self):
+        with self.assertRaises(ValidationError):
+            Cliente(tipo_pessoa="PF", nome="X", documento="39053344704").clean()
+        with self.assertRaises(ValidationError):
+            Cliente(tipo_pessoa="PJ", nome="X", documento="39053344705").clean()
+
+
+class ClienteAdminBuscaTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.pf = Cliente.objects.create(
+            tipo_pessoa="PF", nome="Maria", documento="39053344705", email="maria@exemplo.com"
+        )
+        cls.pj = Cliente.objects.create(
+            tipo_pessoa="PJ", nome="Empresa 2025", documento="11222333000181"
+        )
+
+    def buscar(self, termo):
+        model_admin = site._registry[Cliente]
+        request = RequestFactory().get("/", {"q": termo})
+        qs, _ = model_admin.get_search_results(request, Cliente.objects.all(), termo)
+        return set(qs)
+
+    def test_digitos_buscam_prefixo_do_documento(self):
+        self.assertEqual(self.buscar("390533"), {self.pf})
+
+    def test_documento_formatado(self):
+        self.assertEqual(self.buscar("11.222.333"), {self.pj})
+
+    def test_digitos_tambem_buscam_no_nome(self):
+        self.assertEqual(self.buscar("2025"), {self.pj})
+
+    def test_arroba_busca_email(self):
+        self.assertEqual(self.buscar("maria@"), {self.pf})
+
+    def test_texto_busca_nome(self):
+        self.assertEqual(self.buscar("Empresa"), {self.pj})
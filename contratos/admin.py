@@ -1,4 +1,7 @@
 from django.contrib import admin
+from django.db.models import BooleanField, Case, Q, Value, When
+from django.urls import reverse
+from django.utils import timezone
 from django.utils.html import format_html
 from .models import Servico, Contrato, ItemContrato, ContratoDocumento
 
@@ -13,7 +16,7 @@ class ItemContratoInline(admin.TabularInline):
     verbose_name_plural = "Itens do Contrato (Serviços)"
 
 # Permite anexar arquivos dentro do Contrato
-class ContratoDocumentoInline(admin.StackedInline):
+class ContratoDocumentoInline(admin.TabularInline):
     model = ContratoDocumento
     extra = 0
     fields = ('arquivo', 'nome', 'observacoes')
@@ -26,6 +29,23 @@ class ServicoAdmin(admin.ModelAdmin):
     search_fields = ('nome',) # CRUCIAL para o autocomplete funcionar
     list_filter = ('ativo',)
 
+@admin.register(ItemContrato)
+class ItemContratoAdmin(admin.ModelAdmin):
+    list_display = ('__str__', 'tipo', 'valor_acordado')
+    list_filter = ('tipo',)
+    # Alvo do autocomplete de item_contrato no Lançamento
+    search_fields = ('contrato__nome', 'servico__nome', 'contrato__cliente__nome')
+    ordering = ('contrato', 'id')
+    autocomplete_fields = ['contrato', 'servico']
+
+    def get_queryset(self, request):
+        # Relações lidas pelo __str__ do item
+        return super().get_queryset(request).select_related('servico', 'contrato__cliente')
+
+    def has_module_permission(self, request):
+        # Itens são editados no ItemContratoInline; o registro existe só para o autocomplete
+        return False
+
 @admin.register(Contrato)
 class ContratoAdmin(admin.ModelAdmin):
     list_display = (
@@ -38,6 +58,8 @@ class ContratoAdmin(admin.ModelAdmin):
     )
     list_filter = ('ativo', 'dia_vencimento', 'criado_em')
     search_fields = ('nome', 'cliente__nome')
+    # Ordem estável para a paginação do autocomplete de contrato
+    ordering = ('-data_inicio', '-id')
     
     # Configura os Inlines definidos acima
     inlines = [ItemContratoInline, ContratoDocumentoInline]
@@ -45,13 +67,33 @@ class ContratoAdmin(admin.ModelAdmin):
     # Campo de busca para selecionar cliente (útil se tiver milhares de clientes)
     autocomplete_fields = ['cliente']
 
+    def get_queryset(self, request):
+        # Calcula a vigência no banco, uma vez por consulta, em vez de linha a linha
+        hoje = timezone.now().date()
+        # cliente no mesmo SELECT (usado em __str__ e cliente_link), também no autocomplete
+        return super().get_queryset(request).select_related('cliente').annotate(
+            vigente=Case(
+                When(
+                    Q(ativo=True, data_inicio__lte=hoje)
+                    & (Q(data_fim__isnull=True) | Q(data_fim__gte=hoje)),
+                    then=Value(True),
+                ),
+                default=Value(False),
+                output_field=BooleanField(),
+            )
+        )
+
     def cliente_link(self, obj):
         # Cria um link clicável para ir direto ao cadastro do cliente
-        return format_html('<a href="/admin/clientes/cliente/{}/change/">{}</a>', obj.cliente.id, obj.cliente.nome)
+        url = reverse('admin:clientes_cliente_change', args=[obj.cliente_id])
+        return format_html('<a href="{}">{}</a>', url, obj.cliente.nome)
     cliente_link.short_description = "Cliente"
 
     def status_vigencia(self, obj):
-        if obj.vigente_hoje:
-            return format_html('<span style="color: green;">✔ Vigente</span>')
-        return format_html('<span style="color: red;">✖ Encerrado/Inativo</span>')
-    status_vigencia.short_description = "Vigência"
\ No newline at end of file
+        if obj.vigente:
+            cor, texto = "green", "✔ Vigente"
+        else:
+            cor, texto = "red", "✖ Encerrado/Inativo"
+        return format_html('<span style="color: {};">{}</span>', cor, texto)
+    status_vigencia.short_description = "Vigência"
+    status_vigencia.admin_order_field = "vigente"
\ No newline at end of file
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.8 on 2026-10-15 00:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clientes', '0004_cliente_cli_ativo_tipo_idx_cliente_cli_criado_em_idx'),
+        ('contratos', '0002_alter_contratodocumento_arquivo'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contrato',
+            index=models.Index(fields=['ativo', 'dia_vencimento'], name='ctr_ativo_venc_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contrato',
+            index=models.Index(fields=['-criado_em'], name='ctr_criado_em_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contrato',
+            index=models.Index(fields=['data_inicio', 'data_fim'], name='ctr_vigencia_idx'),
+        ),
+    ]
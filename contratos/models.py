@@ -1,6 +1,7 @@
 from django.db import models
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.core.validators import FileExtensionValidator
+from django.utils import timezone
 
 class Servico(models.Model):
     """
@@ -62,6 +63,13 @@ class Contrato(models.Model):
     class Meta:
         verbose_name = "Contrato"
         verbose_name_plural = "Contratos"
+        indexes = [
+            # filtros laterais do admin (ativo, dia_vencimento, criado_em)
+            models.Index(fields=["ativo", "dia_vencimento"], name="ctr_ativo_venc_idx"),
+            models.Index(fields=["-criado_em"], name="ctr_criado_em_idx"),
+            # consultas de vigência
+            models.Index(fields=["data_inicio", "data_fim"], name="ctr_vigencia_idx"),
+        ]
 
     def __str__(self):
         # Se não tiver nome, usa padrão Contrato {id} - {cliente}
@@ -70,16 +78,22 @@ class Contrato(models.Model):
         cliente_nome = self.cliente.nome if self.cliente_id else "sem cliente"
         if self.id:
             return f"Contrato {self.id} - {cliente_nome}"
+
+    def vigente_em(self, data):
+        """
+        Verifica se o contrato está vigente na data informada.
+        Permite reaproveitar a mesma data ao avaliar vários contratos.
+        """
+        if self.data_fim:
+            return self.ativo and self.data_inicio <= data <= self.data_fim
+        return self.ativo and self.data_inicio <= data
+
     @property
     def vigente_hoje(self):
         """
         Exemplo de helper: verifica se o contrato está vigente hoje.
         """
-        from django.utils import timezone
-        hoje = timezone.now().date()
-        if self.data_fim:
-            return self.ativo and self.data_inicio <= hoje <= self.data_fim
-        return self.ativo and self.data_inicio <= hoje
+        return self.vigente_em(timezone.now().date())
 
 
 class ItemContrato(models.Model):
@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 import os
+import sys
 from pathlib import Path
 import dotenv
 dotenv.load_dotenv()
@@ -190,6 +191,11 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Nos testes, hash de senha rápido (PBKDF2 faz centenas de milhares de iterações).
+# Nunca usar fora dos testes.
+if len(sys.argv) > 1 and sys.argv[1] == 'test':
+    PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/5.2/topics/i18n/
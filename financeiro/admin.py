@@ -1,22 +1,54 @@
 from django.contrib import admin
+from django.contrib.admin.views.main import SEARCH_VAR, ChangeList
+from django.utils import timezone
 from django.utils.html import format_html
 
 from .models import Banco, Categoria, CentroCusto, ContaBancaria, Lancamento
 
 
+# Texto fixo da coluna de situação; não há marcação, então dispensa format_html
+SITUACAO_ICONES = {
+    'PAGO': 'Pago',
+    'CANCELADO': 'Cancelado',
+}
+
+
 # --- ACOES EM MASSA ---
 @admin.action(description='Marcar selecionados como PAGO')
 def marcar_como_pago(modeladmin, request, queryset):
-    updated = queryset.update(situacao='PAGO')
+    # update() não passa pelo auto_now, por isso atualizado_em vai explícito
+    updated = queryset.update(situacao='PAGO', atualizado_em=timezone.now())
     modeladmin.message_user(request, f'{updated} lancamentos marcados como PAGO com sucesso.')
 
 
 @admin.action(description='Marcar selecionados como PENDENTE')
 def marcar_como_pendente(modeladmin, request, queryset):
-    updated = queryset.update(situacao='PENDENTE')
+    updated = queryset.update(situacao='PENDENTE', atualizado_em=timezone.now())
     modeladmin.message_user(request, f'{updated} lancamentos marcados como PENDENTE.')
 
 
+class LancamentoChangeList(ChangeList):
+    """
+    Listagem de lançamentos carregando só as colunas exibidas/editáveis.
+    O formulário de edição continua usando o queryset completo do admin.
+    """
+
+    campos_listagem = (
+        'descricao',
+        'data',
+        'data_vencimento',
+        'valor',
+        'tipo',
+        'situacao',
+        'conta',
+        'nota_fiscal_emitida',
+    )
+
+    def get_queryset(self, request, exclude_parameters=None):
+        qs = super().get_queryset(request, exclude_parameters)
+        return qs.only(*self.campos_listagem)
+
+
 @admin.register(Lancamento)
 class LancamentoAdmin(admin.ModelAdmin):
     list_display = (
@@ -45,6 +77,9 @@ class LancamentoAdmin(admin.ModelAdmin):
 
     date_hierarchy = 'data_vencimento'
     list_per_page = 50
+
+    # 'conta' aparece na listagem e seu __str__ lê o banco: tudo num só JOIN
+    list_select_related = ('conta__banco',)
     actions = [marcar_como_pago, marcar_como_pendente]
 
     fieldsets = (
@@ -54,18 +89,40 @@ class LancamentoAdmin(admin.ModelAdmin):
         ('Fiscal e Controle', {'fields': ('nota_fiscal_emitida', 'eh_extra', 'aviso_vencimento_enviado')}),
     )
 
+    def get_changelist(self, request, **kwargs):
+        return LancamentoChangeList
+
+    def get_search_fields(self, request):
+        # Termos curtos buscam só na descrição, sem JOIN com cliente/contrato
+        termo = request.GET.get(SEARCH_VAR, '').strip()
+        if len(termo) < 3:
+            return ('descricao',)
+        return super().get_search_fields(request)
+
+    # Tabelas que crescem com o uso viram busca (AJAX) em vez de <select> completo
+    autocomplete_fields = ('cliente', 'contrato', 'item_contrato', 'categoria', 'centro_custo')
+
+    # Relações lidas pelo __str__ das opções dos selects do formulário
+    _select_related_opcoes = {
+        'conta': ('banco',),
+        'contrato': ('cliente',),
+        'item_contrato': ('servico', 'contrato__cliente'),
+    }
+
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        relacoes = self._select_related_opcoes.get(db_field.name)
+        if relacoes:
+            kwargs['queryset'] = db_field.related_model._default_manager.select_related(*relacoes)
+        return super().formfield_for_foreignkey(db_field, request, **kwargs)
+
     def valor_colorido(self, obj):
         color = 'green' if obj.tipo == 'ENTRADA' else 'red'
-        return format_html(f'<span style="color: {color}; font-weight: bold;">R$ {obj.valor}</span>')
+        return format_html('<span style="color: {}; font-weight: bold;">R$ {}</span>', color, obj.valor)
 
     valor_colorido.short_description = 'Valor'
 
     def situacao_icon(self, obj):
-        if obj.situacao == 'PAGO':
-            return format_html('Pago')
-        if obj.situacao == 'CANCELADO':
-            return format_html('Cancelado')
-        return format_html('Pendente')
+        return SITUACAO_ICONES.get(obj.situacao, 'Pendente')
 
     situacao_icon.short_description = 'Situacao'
 
@@ -73,15 +130,35 @@ class LancamentoAdmin(admin.ModelAdmin):
 @admin.register(ContaBancaria)
 class ContaBancariaAdmin(admin.ModelAdmin):
     list_display = ('nome', 'banco', 'tipo_conta', 'exibir_saldo')
+    search_fields = ('nome', 'banco__nome')
+
+    def get_queryset(self, request):
+        # Saldo de todas as contas da página calculado na mesma consulta
+        return super().get_queryset(request).com_saldo()
 
     def exibir_saldo(self, obj):
-        saldo = obj.saldo_atual
+        saldo = obj.saldo_calculado
         color = 'blue' if saldo >= 0 else 'red'
-        return format_html(f'<span style="color: {color}; font-weight: bold;">R$ {saldo:.2f}</span>')
+        return format_html('<span style="color: {}; font-weight: bold;">R$ {}</span>', color, f'{saldo:.2f}')
 
     exibir_saldo.short_description = "Saldo Atual (Calculado)"
+    exibir_saldo.admin_order_field = 'saldo_calculado'
+
+
+@admin.register(Categoria)
+class CategoriaAdmin(admin.ModelAdmin):
+    list_display = ('nome', 'tipo')
+    list_filter = ('tipo',)
+    search_fields = ('nome',)
+    ordering = ('nome', 'id')
+
+
+@admin.register(CentroCusto)
+class CentroCustoAdmin(admin.ModelAdmin):
+    search_fields = ('nome',)
+    ordering = ('nome', 'id')
 
 
-admin.site.register(Categoria)
-admin.site.register(CentroCusto)
-admin.site.register(Banco)
+@admin.register(Banco)
+class BancoAdmin(admin.ModelAdmin):
+    search_fields = ('nome', 'codigo')
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.8 on 2026-10-15 00:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clientes', '0004_cliente_cli_ativo_tipo_idx_cliente_cli_criado_em_idx'),
+        ('contratos', '0003_contrato_ctr_ativo_venc_idx_and_more'),
+        ('financeiro', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='lancamento',
+            index=models.Index(fields=['-data', '-id'], name='lanc_data_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='lancamento',
+            index=models.Index(fields=['situacao', 'data_vencimento'], name='lanc_situacao_venc_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='lancamento',
+            index=models.Index(condition=models.Q(('situacao', 'PAGO')), fields=['conta', 'tipo'], name='lanc_pago_idx'),
+        ),
+    ]
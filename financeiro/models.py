@@ -1,5 +1,8 @@
+from decimal import Decimal
+
 from django.db import models
-from django.db.models import Sum
+from django.db.models import F, Q, Sum, Value
+from django.db.models.functions import Coalesce
 
 class Categoria(models.Model):
     """
@@ -68,6 +71,35 @@ class Banco(models.Model):
         return f"{self.nome} ({self.codigo})" if self.codigo else self.nome
 
 
+def movimento_pago(prefixo=""):
+    """
+    Expressão de entradas pagas - saídas pagas (0 quando não há lançamentos).
+    Fonte única da regra usada por saldo_atual e ContaBancariaQuerySet.com_saldo;
+    'prefixo' é o caminho até o lançamento (ex.: "lancamentos__").
+    """
+    def total(tipo):
+        return Coalesce(
+            Sum(
+                f"{prefixo}valor",
+                filter=Q(**{f"{prefixo}tipo": tipo, f"{prefixo}situacao": "PAGO"}),
+            ),
+            Value(Decimal("0")),
+        )
+
+    return total("ENTRADA") - total("SAIDA")
+
+
+class ContaBancariaQuerySet(models.QuerySet):
+    def com_saldo(self):
+        """
+        Anota 'saldo_calculado' (mesma regra de saldo_atual) em uma única
+        consulta, para listagens que exibem o saldo de várias contas.
+        """
+        return self.annotate(
+            saldo_calculado=F("saldo_inicial") + movimento_pago("lancamentos__")
+        )
+
+
 class ContaBancaria(models.Model):
     """
     Representa uma conta bancária (Nubank PJ, Inter PF, Itaú Poupança, etc.).
@@ -115,6 +147,8 @@ class ContaBancaria(models.Model):
     criado_em = models.DateTimeField(auto_now_add=True)
     atualizado_em = models.DateTimeField(auto_now=True)
 
+    objects = ContaBancariaQuerySet.as_manager()
+
     class Meta:
         verbose_name = "Conta bancária"
         verbose_name_plural = "Contas bancárias"
@@ -128,13 +162,8 @@ class ContaBancaria(models.Model):
         Calcula saldo atual com base nos lançamentos já pagos.
         Entradas - Saídas + saldo_inicial.
         """
-        entradas = self.lancamentos.filter(
-            tipo="ENTRADA", situacao="PAGO"
-        ).aggregate(total=Sum("valor"))["total"] or 0
-        saidas = self.lancamentos.filter(
-            tipo="SAIDA", situacao="PAGO"
-        ).aggregate(total=Sum("valor"))["total"] or 0
-        return self.saldo_inicial + entradas - saidas
+        movimento = self.lancamentos.aggregate(movimento=movimento_pago())["movimento"]
+        return self.saldo_inicial + movimento
 
 
 
@@ -241,6 +270,18 @@ class Lancamento(models.Model):
         verbose_name = "Lançamento"
         verbose_name_plural = "Lançamentos"
         ordering = ["-data", "-id"]
+        indexes = [
+            # ordenação padrão da listagem
+            models.Index(fields=["-data", "-id"], name="lanc_data_id_idx"),
+            # filtros do admin por situação e vencimento
+            models.Index(fields=["situacao", "data_vencimento"], name="lanc_situacao_venc_idx"),
+            # saldo das contas: só lançamentos pagos entram na soma
+            models.Index(
+                fields=["conta", "tipo"],
+                condition=Q(situacao="PAGO"),
+                name="lanc_pago_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.tipo} - {self.descricao} - {self.valor}"
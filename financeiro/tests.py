@@ -1,3 +1,56 @@
+from datetime import date
+from decimal import Decimal
+
 from django.test import TestCase
 
-# Create your tests here.
+from .models import Banco, Categoria, ContaBancaria, Lancamento
+
+
+class SaldoContaTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        banco = Banco.objects.create(nome="Banco X")
+        cls.cat_entrada = Categoria.objects.create(nome="Receita", tipo="ENTRADA")
+        cls.cat_saida = Categoria.objects.create(nome="Despesa", tipo="SAIDA")
+        cls.conta = ContaBancaria.objects.create(
+            banco=banco, nome="Conta PJ", saldo_inicial=Decimal("100.00")
+        )
+        cls.conta_vazia = ContaBancaria.objects.create(
+            banco=banco, nome="Conta vazia", saldo_inicial=Decimal("50.00")
+        )
+
+        def lancamento(tipo, valor, situacao):
+            categoria = cls.cat_entrada if tipo == "ENTRADA" else cls.cat_saida
+            Lancamento.objects.create(
+                tipo=tipo,
+                categoria=categoria,
+                conta=cls.conta,
+                descricao=f"{tipo} {situacao}",
+                valor=Decimal(valor),
+                data=date(2025, 1, 10),
+                situacao=situacao,
+            )
+
+        lancamento("ENTRADA", "200.50", "PAGO")
+        lancamento("SAIDA", "40.30", "PAGO")
+        # pendentes e cancelados não entram no saldo
+        lancamento("ENTRADA", "999.00", "PENDENTE")
+        lancamento("SAIDA", "888.00", "PENDENTE")
+        lancamento("SAIDA", "777.00", "CANCELADO")
+
+    def saldo_calculado(self, conta):
+        return ContaBancaria.objects.com_saldo().get(pk=conta.pk).saldo_calculado
+
+    def test_saldo_atual_considera_so_pagos(self):
+        self.assertEqual(self.conta.saldo_atual, Decimal("260.20"))
+
+    def test_com_saldo_igual_a_saldo_atual(self):
+        self.assertEqual(self.saldo_calculado(self.conta), self.conta.saldo_atual)
+
+    def test_conta_sem_lancamentos(self):
+        self.assertEqual(self.conta_vazia.saldo_atual, Decimal("50.00"))
+        self.assertEqual(self.saldo_calculado(self.conta_vazia), self.conta_vazia.saldo_atual)
+
+    def test_saldo_atual_em_uma_consulta(self):
+        with self.assertNumQueries(1):
+            self.conta.saldo_atual